@@ -1,15 +1,102 @@
+from datamanipylator.analyzers import AnalyzerTransform
+from datamanipylator.data import Data
+from datamanipylator.exceptions import NotAnAnalyzer
+
+
+# sentinel returned by a fused pass for items rejected by a filter
+_SKIP = object()
+
+# analyzer types that operate item by item and can be fused in one pass
+_FUSIBLE = ('map', 'filter')
+
+# valid analyzer types, each one with a method of the same name in Data
+_METHODS = frozenset(Data._DISPATCH) | {'sort'}
+
+
+class _FusedMapFilter(AnalyzerTransform):
+    """
+    single-pass replacement for a run of consecutive
+    map and filter analyzers.
+    Items are mapped and filtered in the same order the
+    analyzers were added, building only one output list.
+    """
+    __slots__ = ('analyzer_l', 'steps')
+
+    def __init__(self, analyzer_l):
+        self.analyzer_l = analyzer_l
+        steps = []
+        for analyzer in analyzer_l:
+            if analyzer.analyzertype == 'map':
+                steps.append((True, analyzer.map))
+            else:
+                steps.append((False, analyzer.filter))
+        self.steps = tuple(steps)
+
+    def fused(self, item):
+        for ismap, func in self.steps:
+            if ismap:
+                item = func(item)
+            elif not func(item):
+                return _SKIP
+        return item
+
+    def transform(self, l):
+        fused = self.fused
+        return [v for v in (fused(x) for x in l) if v is not _SKIP]
+
+    def __repr__(self):
+        return '<_FusedMapFilter %s>' %self.analyzer_l
+
+
 class Algorithm(object):
     """
     container for multiple Analyzer objects
     """
     def __init__(self):
         self.analyzer_l= []
+        # the method to call for each Analyzer object
+        self._methodname_l = []
 
     def add(self, analyzer):
+        analyzertype = getattr(analyzer, 'analyzertype', None)
+        if not isinstance(analyzertype, str) or analyzertype not in _METHODS:
+            raise NotAnAnalyzer()
         self.analyzer_l.append(analyzer)
+        self._methodname_l.append(analyzertype)
+
+    def _stages(self):
+        """
+        groups maximal runs of map/filter analyzers into a single
+        fused analyzer. Any other analyzer acts as a barrier.
+        :rtype list: list of (method name, Analyzer object)
+        """
+        stages = []
+        run = []
+        for analyzertype, analyzer in zip(self._methodname_l, self.analyzer_l):
+            if analyzertype in _FUSIBLE and \
+                    getattr(analyzer, 'kernel', None) is None:
+                run.append(analyzer)
+                continue
+            stages.extend(self._close_run(run))
+            run = []
+            stages.append((analyzertype, analyzer))
+        stages.extend(self._close_run(run))
+        return stages
+
+    def _close_run(self, run):
+        if len(run) > 1:
+            return [('transform', _FusedMapFilter(run))]
+        return [(analyzer.analyzertype, analyzer) for analyzer in run]
 
     def analyze(self, input_data):
         tmp_out = input_data
-        for analyzer in self.analyzer_l:
-            tmp_out = tmp_out.analyze(analyzer)
+        for methodname, analyzer in self._stages():
+            if type(analyzer) is _FusedMapFilter and \
+                    not getattr(tmp_out, '_transformable', False):
+                # i.e. columnar data, with no transform(): 
+                # the fused analyzers are called one by one
+                for step in analyzer.analyzer_l:
+                    tmp_out = getattr(tmp_out, step.analyzertype)(step)
+                continue
+            tmp_out = getattr(tmp_out, methodname)(analyzer)
         return tmp_out
@@ -1,9 +1,27 @@
 class Analyzer(object):
-    pass
+    # subclasses with instance attributes can list them in __slots__ too
+    __slots__ = ()
+    # optional list of attributes passed to the vectorized methods 
+    # for columnar data (vec_filter(), vec_indexby()). All if None
+    columns_used = None
 
 
 class AnalyzerIndexBy(Analyzer):
     analyzertype = "indexby"
+    __slots__ = ()
+    # optional method vec_indexby(cols) for columnar data,
+    # receiving a dictionary of numpy arrays, one per attribute,
+    # and returning an array with the key for each row
+    vec_indexby = None
+    # optional dictionary {value: key} for columnar data, 
+    # translating the values in column 'attribute' into keys at once. 
+    # Rows whose value is not in the dictionary are not indexed
+    mapping = None
+    # optional name of the attribute translated by mapping. 
+    # Without mapping nor vec_indexby(), the value of the attribute 
+    # is the key, and columnar data is grouped by its integer codes
+    attribute = None
+
     def indexby(self, item):
         """
         Implementation of an indexby() method:
@@ -14,11 +32,28 @@ class AnalyzerIndexBy(Analyzer):
         :return: the key of the dictionary being created 
         :rtype: str
         """
-        raise NotImplementedError
+        # by default, the value of attribute, translated with mapping if any
+        if self.attribute is None:
+            raise NotImplementedError
+        value = getattr(item, self.attribute)
+        if self.mapping is not None:
+            return self.mapping.get(value)
+        return value
 
 
 class AnalyzerFilter(Analyzer):
     analyzertype = "filter"
+    __slots__ = ()
+    # optional compiled function (i.e. numba @njit) 
+    # receiving a numpy array with all items 
+    # and returning a boolean mask with the items to be kept
+    kernel = None
+    # optional method vec_filter(cols) for columnar data, 
+    # evaluating all rows at once. It receives a dictionary 
+    # of numpy arrays, one per attribute, and returns a boolean mask 
+    # with the rows to be kept. Other data uses filter()
+    vec_filter = None
+
     def filter(self, item):
         """
         Implementation of a filter() method:
@@ -34,6 +69,12 @@ class AnalyzerFilter(Analyzer):
 
 class AnalyzerMap(Analyzer):
     analyzertype = "map"
+    __slots__ = ()
+    # optional compiled function (i.e. numba @njit) 
+    # receiving a numpy array with all items 
+    # and returning a numpy array with the new values
+    kernel = None
+
     def map(self, item):
         """
         Implementation of a map() method:
@@ -49,6 +90,28 @@ class AnalyzerMap(Analyzer):
 
 class AnalyzerReduce(Analyzer):
     analyzertype = "reduce"
+    __slots__ = ('init_value',)
+    # optional compiled function (i.e. numba @njit) 
+    # receiving a numpy array with all items, 
+    # plus the initial value when there is one, 
+    # and returning the aggregated value
+    kernel = None
+    # optional name of the items attribute to reduce with kernel or op.
+    # When set, the kernel receives a float64 array with that attribute
+    # from every item, instead of an array with the items themselves,
+    # and op aggregates that attribute instead of the items.
+    # For columnar data, it is the column reduced with kernel or op
+    attribute = None
+    # optional name of a builtin aggregation: 'sum', 'prod', 'min' or 'max'.
+    # When set, it is used instead of calling reduce() for each item
+    op = None
+    # optional compiled function reducing all groups at once 
+    # in pipeline() for columnar data, used instead of kernel or op.
+    # It receives the values of column attribute, the group of each row, 
+    # the number of groups, plus the initial value when there is one, 
+    # and returns an array with the aggregated value of each group
+    group_kernel = None
+
     def __init__(self, init_value=None):
         self.init_value = init_value
 
@@ -73,6 +136,7 @@ class AnalyzerReduce(Analyzer):
 
 class AnalyzerTransform(Analyzer):
     analyzertype = "transform"
+    __slots__ = ()
     def transform(self, l):
         """
         Implementation of a transform() method:
@@ -88,6 +152,7 @@ class AnalyzerTransform(Analyzer):
 
 class AnalyzerSort(Analyzer):
     analyzertype = "sort"
+    __slots__ = ()
     def sort(self, item1, item2):
         """
         Implementation of a sort() method:
@@ -105,6 +170,7 @@ class AnalyzerSort(Analyzer):
 
 class AnalyzerProcess(Analyzer):
     analyzertype = "process"
+    __slots__ = ()
     def process(self):
         """
         Implementation of a process() method:
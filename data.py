@@ -4,18 +4,16 @@ __author__ = "Jose Caballero"
 __email__ = "jcaballero.hep@gmail.com"
 
 
-import datetime
-import inspect
 import logging
-import logging.handlers
-import threading
+import operator
 import time
-import traceback
-import os
-import pwd
-import sys
+import weakref
 
+from collections import defaultdict
 from  functools import reduce
+from itertools import chain
+from math import prod
+from operator import attrgetter
 
 from datamanipylator.exceptions import (
     IncorrectInputDataType,
@@ -38,35 +36,207 @@ from datamanipylator.analyzers import (
     AnalyzerProcess,
 )
 
+
+_LOG = logging.getLogger('info')
+_LOG.addHandler(logging.NullHandler())
+
+# return types of indexby() meaning "several keys". 
+# Exact types, so i.e. a namedtuple is a single key
+_MULTIKEY = frozenset((tuple, list))
+
+# builtin functions for the AnalyzerReduce op values
+_REDUCE_OPS = {
+    'sum': sum,
+    'prod': prod,
+    'min': min,
+    'max': max,
+}
+
+# binary functions for the AnalyzerReduce op values, for pipeline()
+_BINARY_OPS = {
+    'sum': operator.add,
+    'prod': operator.mul,
+    'min': min,
+    'max': max,
+}
+
+# numpy ufuncs for the AnalyzerReduce op values, for columnar data
+_UFUNC_OPS = {
+    'sum': 'add',
+    'prod': 'multiply',
+    'min': 'minimum',
+    'max': 'maximum',
+}
+
+
+def _asarray(data, dtype=None):
+    """
+    converts a list of items into a numpy array,
+    to be passed to compiled kernels or vectorized analyzers.
+    numpy is only imported when one of them is actually used
+    """
+    import numpy
+    return numpy.asarray(data, dtype=dtype)
+
+def _column(values):
+    """
+    converts a list of values into a column for columnar data.
+    Columns that are not only numbers are kept as arrays of Python objects,
+    so numpy does not convert, for example, ['a', 7] into ['a', '7'].
+    The types are checked first: numpy.asarray() on strings would build 
+    a fixed-width array as wide as the longest one, only to discard it
+    :param values: list of values
+    :rtype numpy.ndarray:
+    """
+    import numpy
+    numbers = (int, float, numpy.number, numpy.bool_)
+    if all(isinstance(value, numbers) for value in values):
+        arr = numpy.asarray(values)
+        if arr.dtype.kind in 'biuf':
+            return arr
+    return numpy.fromiter(values, dtype=object, count=len(values))
+
+def _apply_job(job):
+    """
+    calls the method on a Data object, for the pools in _DictData
+    :param job: tuple (Data object, method name, analyzer)
+    """
+    data, methodname, analyzer = job
+    return getattr(data, methodname)(analyzer)
+
+
+def _sequential():
+    """
+    initializer for the worker processes, 
+    so they do not start pools of their own
+    """
+    Data.parallelism = None
+
+def _fromattr(data, attribute):
+    """
+    builds a contiguous float64 numpy array with the value 
+    of the same attribute for every item, 
+    to be passed to compiled kernels
+    """
+    import numpy
+    return numpy.fromiter((getattr(item, attribute) for item in data),
+                          dtype=numpy.float64,
+                          count=len(data))
+
+def _factorize(values):
+    """
+    replaces each value by an integer code, 
+    so rows can be grouped without hashing or sorting the values again.
+    Values that can not be sorted together, like None among strings, 
+    get their codes from a dictionary, in order of first appearance
+    :return: int32 array with the code of each value, 
+             and array of distinct values, indexed by code
+    """
+    import numpy
+    try:
+        uniques, codes = numpy.unique(values, return_inverse=True)
+    except TypeError:
+        index = {}
+        codes = numpy.fromiter((index.setdefault(value, len(index)) 
+                                for value in values.tolist()),
+                               dtype=numpy.int32, 
+                               count=len(values))
+        uniques = numpy.empty(len(index), dtype=object)
+        for i, value in enumerate(index):
+            uniques[i] = value
+        return codes, uniques
+    return codes.ravel().astype(numpy.int32), uniques
+
+def _vectorized_indexby(analyzer):
+    """
+    True for indexby analyzers that compute all keys at once, 
+    with vec_indexby(), with a mapping, or with just an attribute, 
+    for columnar data
+    """
+    return getattr(analyzer, 'mapping', None) is not None or \
+        getattr(analyzer, 'vec_indexby', None) is not None or \
+        getattr(analyzer, 'attribute', None) is not None
+
+def _vectorized_reduce(analyzer):
+    """
+    True for reduce analyzers that reduce a whole column at once, 
+    with op, kernel or group_kernel, for columnar data
+    """
+    return getattr(analyzer, 'attribute', None) is not None and \
+        (getattr(analyzer, 'op', None) is not None or 
+         getattr(analyzer, 'kernel', None) is not None or
+         getattr(analyzer, 'group_kernel', None) is not None)
+
+def _check_pipeline(filters, indexers, reducer):
+    """
+    validates the analyzers passed to pipeline(), as validate_call does
+    """
+    for analyzer_l, analyzertype in ((filters, 'filter'), 
+                                     (indexers, 'indexby'),
+                                     ([reducer] if reducer is not None else [], 'reduce')):
+        for analyzer in analyzer_l:
+            if analyzer.analyzertype != analyzertype:
+                raise IncorrectAnalyzer(analyzer, analyzer.analyzertype, analyzertype)
+
+
+def _chain(data, filters, indexers, reducer):
+    """
+    pipeline() calling each method in turn
+    """
+    for analyzer in filters:
+        data = data.filter(analyzer)
+    for analyzer in indexers:
+        data = data.indexby(analyzer)
+    if reducer is not None:
+        data = data.reduce(reducer)
+    return data
+
+
+def _wrap_tree(tree, depth, leaf, dictclass, timestamp):
+    """
+    converts the nested dictionaries built by pipeline() 
+    into nested dictclass objects
+    :param tree: nested dictionaries
+    :param depth: number of levels of dictionaries
+    :param leaf: function converting the content of the last level
+    """
+    if depth == 0:
+        return leaf(tree)
+    new_data = {key: _wrap_tree(value, depth - 1, leaf, dictclass, timestamp)
+                for key, value in tree.items()}
+    return dictclass(new_data, timestamp=timestamp)
+
 # =============================================================================
 # Base classes and interfaces
 # =============================================================================
 
 class _Base(object):
 
+    # no per-instance __dict__: nested indexby() can create many objects
+    __slots__ = ('log', 'data', 'timestamp')
+
     def __init__(self, data, timestamp=None):
         """ 
         :param data: the data to be recorded
         :param timestamp: the time when this object was created
         """ 
-        self.log = logging.getLogger('info')
-        self.log.addHandler(logging.NullHandler())
+        self.log = _LOG
+        debug = _LOG.isEnabledFor(logging.DEBUG)
 
-        msg ='Initializing object with input options: \
-data={data}, timestamp={timestamp}'
-        msg = msg.format(data=data,
-                         timestamp=timestamp)
-        self.log.debug(msg)
+        if debug:
+            self.log.debug('Initializing object with input options: '
+                           'data=%s, timestamp=%s', data, timestamp)
 
         self.data = data 
 
-        if not timestamp:
+        if timestamp is None:
             timestamp = int(time.time())
-            msg = 'Setting timestamp to %s' %timestamp
-            self.log.debug(msg)
+            if debug:
+                self.log.debug('Setting timestamp to %s', timestamp)
         self.timestamp = timestamp
 
-        self.log.debug('Object initialized')
+        if debug:
+            self.log.debug('Object initialized')
 
 
     def get(self, *key_l):
@@ -81,7 +251,7 @@ data={data}, timestamp={timestamp}'
             return self.data
         else:
             key = key_l[0]
-            if key not in self.data.keys():
+            if key not in self.data:
                 raise MissingKeyException(key)
             data = self.data[key]
             return data.get(*key_l[1:])
@@ -91,16 +261,15 @@ class _BaseDict(_Base):
     """
     adds an extra check for the input data
     """
+    __slots__ = ()
+
     def __init__(self, data, timestamp=None):
         super(_BaseDict, self).__init__(data, timestamp)
         if type(self.data) is not dict:
             raise IncorrectInputDataType(dict)
 
     def getraw(self):
-        out = {}
-        for key, value in self.data.items():
-            out[key] = value.getraw()
-        return out
+        return {key: value.getraw() for key, value in self.data.items()}
 
     def __getitem__(self, key):
         """
@@ -108,7 +277,7 @@ class _BaseDict(_Base):
         :param key: the key in the higher level dictionary
         :rtype Data: 
         """
-        if key not in self.data.keys():
+        if key not in self.data:
             raise MissingKeyException(key)
         return self.data[key]
 
@@ -116,6 +285,8 @@ class _BaseDict(_Base):
 
 class _GetRawBase:
 
+    __slots__ = ()
+
     def getraw(self):
         return self.data
 
@@ -124,6 +295,8 @@ class _GetRawBase:
 
 class _AnalysisInterface:
 
+    __slots__ = ()
+
     def indexby(self, analyzer):
         raise NotImplementedError
 
@@ -152,11 +325,22 @@ class _AnalysisInterface:
 
 class Data(_Base, _AnalysisInterface, _GetRawBase):
 
+    __slots__ = ()
+
+    # how _DictData processes its keys: None (sequentially), 
+    # 'threads' or 'processes'
+    parallelism = None
+    # minimum number of keys to use a pool
+    parallel_threshold = 8
+
+    # transform() can process the list of items, 
+    # so Algorithm can fuse consecutive map() and filter() into one pass
+    _transformable = True
+
     def __init__(self, data, timestamp=None):
         super(Data, self).__init__(data, timestamp)
         if type(self.data) is not list:
-            msg = 'Input data %s is not a dict. Raising exception' %data
-            self.log.error(msg)
+            self.log.error('Input data %s is not a list. Raising exception', data)
             raise IncorrectInputDataType(list)
 
 
@@ -168,22 +352,34 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
         :rtype Data:
         """
         self.log.debug('Starting')
-        if analyzer.analyzertype == 'indexby':
-            return self.indexby(analyzer)
-        elif analyzer.analyzertype == 'map':
-            return self.map(analyzer)
-        elif analyzer.analyzertype == 'filter':
-            return self.filter(analyzer)
-        elif analyzer.analyzertype == 'reduce':
-            return self.reduce(analyzer)
-        elif analyzer.analyzertype == 'transform':
-            return self.transform(analyzer)
-        elif analyzer.analyzertype == 'process':
-            return self.process(analyzer)
-        else:
-            msg = 'Input object %s is not a valid analyzer. Raising exception.'
-            self.log.error(msg)
+        try:
+            method = self._DISPATCH[analyzer.analyzertype]
+        except (KeyError, AttributeError):
+            self.log.error('Input object %s is not a valid analyzer. '
+                           'Raising exception.', analyzer)
             raise NotAnAnalyzer()
+        return method(self, analyzer)
+
+
+    def _iter(self):
+        """
+        iterator over the items, 
+        used as source by the lazy map() and filter()
+        """
+        return iter(self.data)
+
+    def _source(self):
+        """
+        function returning an iterator over the items, 
+        for a new lazy object built from this one
+        """
+        return self._iter
+
+    def _pending(self):
+        """
+        list of analyzers not yet applied to the items
+        """
+        return []
 
 
     def apply_algorithm(self, algorithm):
@@ -211,7 +407,7 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
                          implementing method indexby()
         :rtype Data:
         """
-        self.log.debug('Starting with analyzer %s' %analyzer)
+        self.log.debug('Starting with analyzer %s', analyzer)
 
         new_data = self.__indexby(analyzer)
         new_info = _DictData(new_data, timestamp=self.timestamp)
@@ -220,18 +416,19 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
     @catch_exception
     def __indexby(self, analyzer):
         # 1
-        tmp_new_data = {}
+        tmp_new_data = defaultdict(list)
+        indexby = analyzer.indexby
+        multikey = _MULTIKEY
         for item in self.data:
-            key_l = analyzer.indexby(item)
-            if key_l is not None:
-                if not type(key_l) in  [tuple, list]:
-                    # indexyby( ) may return a tuple, a list, or a single value
-                    # in the last case, let's convert it into an interable
-                    key_l = [key_l]
-                for key in key_l:
-                    if key not in tmp_new_data.keys():
-                        tmp_new_data[key] = []
-                    tmp_new_data[key].append(item)
+            key_l = indexby(item)
+            if key_l is None:
+                continue
+            if type(key_l) not in multikey:
+                # indexyby( ) may return a tuple, a list, or a single value
+                tmp_new_data[key_l].append(item)
+                continue
+            for key in key_l:
+                tmp_new_data[key].append(item)
         # 2
         new_data = {}
         for k, v in tmp_new_data.items():
@@ -251,18 +448,39 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
                           or a function
         :rtype Data:
         """
-        self.log.debug('Starting with lambda %s' %lambdamap)
-        new_data = self.__map(lambdamap)
-        new_info = Data(new_data, timestamp=self.timestamp)
+        self.log.debug('Starting with lambda %s', lambdamap)
+        if getattr(lambdamap, 'kernel', None) is not None:
+            new_data = self.__map(lambdamap)
+            new_info = Data(new_data, timestamp=self.timestamp)
+        else:
+            new_gen = self.__stream_map(lambdamap)
+            new_info = _LazyData(new_gen, 
+                                 self._pending() + [lambdamap], 
+                                 timestamp=self.timestamp)
         return new_info
 
+    def __stream_map(self, lambdamap):
+        """
+        returns a function that creates the iterator 
+        with the mapped items, without building the list
+        """
+        if isinstance(lambdamap, AnalyzerMap):
+            func = lambdamap.map
+        else:
+            func = lambdamap
+        source = self._source()
+        return lambda: map(func, source())
+
 
     @catch_exception
     def __map(self, lambdamap):
         """
-        call to python map() function
+        call to python map() function,
+        or to the analyzer compiled kernel, if any
         """
         if isinstance(lambdamap, AnalyzerMap):
+            if lambdamap.kernel is not None:
+                return lambdamap.kernel(_asarray(self.data)).tolist()
             return list(map(lambdamap.map, self.data))
         else:
             return list(map(lambdamap, self.data))
@@ -279,18 +497,42 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
                              or a function
         :rtype Data:
         """
-        self.log.debug('Starting with lambda %s' %lambdafilter)
-        new_data = self.__filter(lambdafilter)
-        new_info = Data(new_data, timestamp=self.timestamp)
+        self.log.debug('Starting with lambda %s', lambdafilter)
+        if getattr(lambdafilter, 'kernel', None) is not None:
+            new_data = self.__filter(lambdafilter)
+            new_info = Data(new_data, timestamp=self.timestamp)
+        else:
+            new_gen = self.__stream_filter(lambdafilter)
+            new_info = _LazyData(new_gen, 
+                                 self._pending() + [lambdafilter], 
+                                 timestamp=self.timestamp)
         return new_info
 
+    def __stream_filter(self, lambdafilter):
+        """
+        returns a function that creates the iterator 
+        with the items passing the filter, without building the list
+        """
+        if isinstance(lambdafilter, AnalyzerFilter):
+            func = lambdafilter.filter
+        else:
+            func = lambdafilter
+        source = self._source()
+        return lambda: filter(func, source())
+
 
     @catch_exception
     def __filter(self, lambdafilter):
         """
-        call to python filter() function
+        call to python filter() function,
+        or to the analyzer compiled kernel, if any,
+        which returns a boolean mask for all items at once.
+        The mask selects the original items, so they keep their type
         """
         if isinstance(lambdafilter, AnalyzerFilter):
+            if lambdafilter.kernel is not None:
+                mask = lambdafilter.kernel(_asarray(self.data))
+                return [item for item, keep in zip(self.data, mask.tolist()) if keep]
             return list(filter(lambdafilter.filter, self.data))
         else:
             return list(filter(lambdafilter, self.data))
@@ -306,7 +548,7 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
                              or a function
         :rtype Data: 
         """
-        self.log.debug('Starting with lambda %s' %lambdareduce)
+        self.log.debug('Starting with lambda %s', lambdareduce)
         new_data = self.__reduce(lambdareduce)
         new_info = _NonMutableData(new_data, 
                               timestamp=self.timestamp)
@@ -315,10 +557,28 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
     @catch_exception
     def __reduce(self, lambdareduce):
         """
-        call to python reduce() function
+        call to python reduce() function,
+        or to the analyzer compiled kernel, 
+        or to the builtin function for the analyzer op, if any
         """
         if isinstance(lambdareduce, AnalyzerReduce):
             initialvalue = lambdareduce.initialvalue()
+            if lambdareduce.kernel is not None:
+                if lambdareduce.attribute is not None:
+                    arr = _fromattr(self.data, lambdareduce.attribute)
+                else:
+                    arr = _asarray(self.data)
+                if initialvalue is not None:
+                    return lambdareduce.kernel(arr, initialvalue)
+                return lambdareduce.kernel(arr)
+            if lambdareduce.op is not None:
+                func = _REDUCE_OPS[lambdareduce.op]
+                values = self.data
+                if lambdareduce.attribute is not None:
+                    values = map(attrgetter(lambdareduce.attribute), values)
+                if initialvalue is not None:
+                    return func(chain((initialvalue,), values))
+                return func(values)
             if initialvalue is not None:
                 return reduce(lambdareduce.reduce, self.data, initialvalue)
             else:
@@ -336,7 +596,7 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
                          implementing method transform()
         :rtype Data: 
         """
-        self.log.debug('Starting with analyzer %s' %analyzer)
+        self.log.debug('Starting with analyzer %s', analyzer)
         new_data = self.__transform(analyzer)
         new_info = Data(new_data, timestamp=self.timestamp)
         return new_info
@@ -356,7 +616,7 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
                          implementing method sort()
         :rtype Data: 
         """
-        self.log.debug('Starting with sort lambda %s' %lambdasort)
+        self.log.debug('Starting with sort lambda %s', lambdasort)
         new_data = self.__sort(lambdasort)
         new_info = Data(new_data, timestamp=self.timestamp)
         return new_info
@@ -377,7 +637,7 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
                          implementing method process()
         :rtype Data: 
         """
-        self.log.debug('Starting with analyzer %s' %analyzer)
+        self.log.debug('Starting with analyzer %s', analyzer)
         new_data = self.__process(analyzer)
         new_info = _NonMutableData(new_data, timestamp=self.timestamp)
         return new_info
@@ -395,96 +655,854 @@ class Data(_Base, _AnalysisInterface, _GetRawBase):
     def __count(self):
         return len(self.data)
 
+    # -------------------------------------------------------------------------
+
+    def to_columnar(self, schema):
+        """
+        converts the list of items into a dictionary of numpy arrays,
+        one per attribute, to be analyzed column by column
+        :param schema: list of attribute names. Each item must accept item[name]
+        :rtype _ColumnarData:
+        """
+        self.log.debug('Starting with schema %s', schema)
+        new_data = self.__to_columnar(schema)
+        new_info = _ColumnarData(new_data, timestamp=self.timestamp)
+        return new_info
+
+    def __to_columnar(self, schema):
+        return {col: _column([item[col] for item in self.data]) 
+                for col in schema}
+
+    @classmethod
+    def from_records(cls, records, fields, numeric_fields=()):
+        """
+        builds columnar data directly from a list of objects, 
+        with one numpy array per attribute
+        :param records: list of objects. Each one must have all fields as attributes
+        :param fields: list of attribute names
+        :param numeric_fields: attributes in fields known to be numbers. 
+                               They are read straight into float64 arrays,
+                               without building an intermediate list
+        :rtype _ColumnarData:
+        """
+        if not hasattr(records, '__len__'):
+            records = list(records)
+        new_data = {}
+        for field in fields:
+            if field in numeric_fields:
+                new_data[field] = _fromattr(records, field)
+            else:
+                new_data[field] = _column([getattr(record, field) for record in records])
+        new_info = _ColumnarData(new_data)
+        return new_info
+
+    # -------------------------------------------------------------------------
+
+    def pipeline(self, filters=(), indexers=(), reducer=None):
+        """
+        same output as calling filter() with each analyzer in filters, 
+        then indexby() with each analyzer in indexers, 
+        and finally reduce() with reducer,
+        but in a single pass over the items, 
+        without creating the intermediate Data objects.
+        :param filters: list of AnalyzerFilter-type objects
+        :param indexers: list of AnalyzerIndexBy-type objects
+        :param reducer: an AnalyzerReduce-type object, or None to only group the items
+        :rtype _NonMutableDictData: or _DictData when there is no reducer
+        """
+        _check_pipeline(filters, indexers, reducer)
+        self.log.debug('Starting with filters %s, indexers %s, reducer %s', 
+                       filters, indexers, reducer)
+        if not indexers:
+            return _chain(self, filters, indexers, reducer)
+        tree = self.__pipeline(filters, indexers, reducer)
+        if reducer is None:
+            leaf = lambda l: Data(l, timestamp=self.timestamp)
+            dictclass = _DictData
+        elif reducer.kernel is not None:
+            leaf = lambda l: Data(l, timestamp=self.timestamp).reduce(reducer)
+            dictclass = _NonMutableDictData
+        else:
+            leaf = lambda value: _NonMutableData(value, timestamp=self.timestamp)
+            dictclass = _NonMutableDictData
+        return _wrap_tree(tree, len(indexers), leaf, dictclass, self.timestamp)
+
+    @catch_exception
+    def __pipeline(self, filters, indexers, reducer):
+        """
+        :return: nested dictionaries, one level per indexer, 
+                 with the list of items, or the accumulated value, 
+                 for each key in the last level
+        """
+        filter_l = [analyzer.filter for analyzer in filters]
+        indexby_l = [analyzer.indexby for analyzer in indexers[:-1]]
+        indexby_last = indexers[-1].indexby
+        multikey = _MULTIKEY
+        accumulate = reducer is not None and reducer.kernel is None
+        getvalue = None
+        if accumulate:
+            if reducer.op is not None:
+                func = _BINARY_OPS[reducer.op]
+                if reducer.attribute is not None:
+                    getvalue = attrgetter(reducer.attribute)
+            else:
+                func = reducer.reduce
+            initialvalue = reducer.initialvalue()
+
+        tree = {}
+        for item in self.data:
+            if not all(f(item) for f in filter_l):
+                continue
+            node_l = [tree]
+            for indexby in indexby_l:
+                key_l = indexby(item)
+                if key_l is None:
+                    break
+                if type(key_l) not in multikey:
+                    node_l = [node.setdefault(key_l, {}) for node in node_l]
+                else:
+                    node_l = [node.setdefault(key, {}) 
+                              for node in node_l for key in key_l]
+            else:
+                key_l = indexby_last(item)
+                if key_l is None:
+                    continue
+                if type(key_l) not in multikey:
+                    key_l = (key_l,)
+                if getvalue is not None:
+                    item = getvalue(item)
+                for node in node_l:
+                    for key in key_l:
+                        if not accumulate:
+                            node.setdefault(key, []).append(item)
+                        elif key in node:
+                            node[key] = func(node[key], item)
+                        elif initialvalue is None:
+                            node[key] = item
+                        else:
+                            node[key] = func(initialvalue, item)
+        return tree
+
+    # -------------------------------------------------------------------------
+
+    # analyzertype -> method, used by analyze()
+    _DISPATCH = {
+        'indexby': indexby,
+        'map': map,
+        'filter': filter,
+        'reduce': reduce,
+        'transform': transform,
+        'process': process,
+    }
+
 # =============================================================================
 
 class _DictData(_BaseDict, _AnalysisInterface):
 
+    __slots__ = ('group_info',)
+
+    def __init__(self, data, timestamp=None, group_info=None):
+        """
+        :param data: dictionary of Data objects
+        :param timestamp: the time when this object was created
+        :param group_info: when built by indexby() on columnar data, 
+                           tuple (parent _ColumnarData, {key: positions of the rows}),
+                           so a further vectorized indexby() can reuse it
+        """
+        super(_DictData, self).__init__(data, timestamp)
+        self.group_info = group_info
+
+    @property
+    def _transformable(self):
+        return all(getattr(data, '_transformable', False) 
+                   for data in self.data.values())
+
+    def _apply(self, methodname, analyzer):
+        """
+        calls methodname(analyzer) on the content of each key.
+        As keys are independent, they are processed in a pool 
+        of threads or processes when Data.parallelism is set
+        and there are at least Data.parallel_threshold keys.
+        :param methodname: the name of the method to call
+        :param analyzer: an Analyzer object
+        :rtype dict:
+        """
+        if Data.parallelism is None or \
+                len(self.data) < Data.parallel_threshold:
+            new_data = {}
+            for key, data in self.data.items():
+                self.log.debug('calling %s() for content in key %s', methodname, key)
+                new_data[key] = getattr(data, methodname)(analyzer)
+            return new_data
+
+        # imported here, as they pull in threading and multiprocessing
+        if Data.parallelism == 'threads':
+            from concurrent.futures import ThreadPoolExecutor
+            executor = ThreadPoolExecutor()
+        elif Data.parallelism == 'processes':
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(initializer=_sequential)
+        else:
+            raise AnalyzerFailure('Unknown parallelism %s' %Data.parallelism)
+        self.log.debug('calling %s() for %s keys with %s', 
+                       methodname, len(self.data), Data.parallelism)
+        jobs = [(data, methodname, analyzer) for data in self.data.values()]
+        with executor:
+            results = executor.map(_apply_job, jobs)
+            return dict(zip(self.data.keys(), results))
+
+    def analyze(self, analyzer):
+        """
+        generic method that picks the right one 
+        based on the type of analyzer
+        :param analyzer: an Analyzer object 
+        :rtype _DictData:
+        """
+        self.log.debug('Starting')
+        try:
+            method = self._DISPATCH[analyzer.analyzertype]
+        except (KeyError, AttributeError):
+            self.log.error('Input object %s is not a valid analyzer. '
+                           'Raising exception.', analyzer)
+            raise NotAnAnalyzer()
+        return method(self, analyzer)
+
     # -------------------------------------------------------------------------
     # methods to manipulate the data
     # -------------------------------------------------------------------------
 
     @validate_call
     def indexby(self, analyzer):
-        new_data = {}
-        for key, data in self.data.items():
-            self.log.debug('calling indexby() for content in key %s'%key)
-            new_data[key] = data.indexby(analyzer)
+        if self.group_info is not None and \
+                self.group_info[0]._vectorizable(analyzer):
+            parent, groups = self.group_info
+            new_data = parent._regroup(analyzer, groups)
+        else:
+            new_data = self._apply('indexby', analyzer)
         new_info = _DictData(new_data, timestamp=self.timestamp)
         return new_info
     
 
     @validate_call
     def map(self, analyzer):
-        new_data = {}
-        for key, data in self.data.items():
-            self.log.debug('calling map() for content in key %s'%key)
-            new_data[key] = data.map(analyzer)
+        new_data = self._apply('map', analyzer)
         new_info = _DictData(new_data, timestamp=self.timestamp)
         return new_info
 
 
     @validate_call
     def filter(self, analyzer):
-        new_data = {}
-        for key, data in self.data.items(): 
-            self.log.debug('calling filter() for content in key %s'%key)
-            new_data[key] = data.filter(analyzer)
+        new_data = self._apply('filter', analyzer)
         new_info = _DictData(new_data, timestamp=self.timestamp)
         return new_info
 
 
     @validate_call
     def reduce(self, analyzer):
-        new_data = {}
-        for key, data in self.data.items(): 
-            self.log.debug('calling reduce() for content in key %s'%key)
-            new_data[key] = data.reduce(analyzer)
+        if self.group_info is not None and _vectorized_reduce(analyzer):
+            parent, groups = self.group_info
+            new_data = {key: _NonMutableData(value, timestamp=self.timestamp)
+                        for key, value in parent._reduce_groups(analyzer, groups).items()}
+        else:
+            new_data = self._apply('reduce', analyzer)
         new_info = _NonMutableDictData(new_data, timestamp=self.timestamp)
         return new_info
 
 
     @validate_call
     def transform(self, analyzer):
-        new_data = {}
-        for key, data in self.data.items(): 
-            self.log.debug('calling transform() for content in key %s'%key)
-            new_data[key] = data.transform(analyzer)
+        new_data = self._apply('transform', analyzer)
         new_info = _DictData(new_data, timestamp=self.timestamp)
         return new_info
 
 
     @validate_call
     def sort(self, analyzer):
-        new_data = {}
-        for key, data in self.data.items(): 
-            self.log.debug('calling sort() for content in key %s'%key)
-            new_data[key] = data.sort(analyzer)
+        new_data = self._apply('sort', analyzer)
         new_info = _DictData(new_data, timestamp=self.timestamp)
         return new_info
 
 
     @validate_call
     def process(self, analyzer):
-        new_data = {}
-        for key, data in self.data.items(): 
-            self.log.debug('calling process() for content in key %s'%key)
-            new_data[key] = data.process(analyzer)
+        new_data = self._apply('process', analyzer)
         new_info = _NonMutableDictData(new_data, timestamp=self.timestamp)
         return new_info
 
     def count(self):
         new_data = {}
         for key, data in self.data.items():
-            self.log.debug('calling process() for content in key %s'%key)
+            self.log.debug('calling count() for content in key %s', key)
             new_data[key] = data.count()
         new_info = _NonMutableDictData(new_data, timestamp=self.timestamp)
         return new_info
 
+    # -------------------------------------------------------------------------
+
+    # analyzertype -> method, used by analyze()
+    _DISPATCH = {
+        'indexby': indexby,
+        'map': map,
+        'filter': filter,
+        'reduce': reduce,
+        'transform': transform,
+        'process': process,
+    }
+
+
+class _LazyData(Data):
+    """
+    Data whose items are produced on demand by chaining 
+    calls to map() and filter().
+    The list of items is only built the first time self.data is needed,
+    for example by indexby(), reduce(), transform(), process() or getraw().
+    When a lazy object built from this one goes through the items 
+    while this one is still referenced elsewhere, the list is also kept,
+    so the analyzers are not called again for this object or other ones built from it.
+    """
+    __slots__ = ('_gen', 'analyzer_l', '_data', '__weakref__')
+
+    def __init__(self, gen, analyzer_l, timestamp=None):
+        """
+        :param gen: function returning an iterator over the new items
+        :param analyzer_l: the analyzers applied by gen, for error messages
+        :param timestamp: the time when this object was created
+        """
+        self._gen = gen
+        self.analyzer_l = analyzer_l
+        _Base.__init__(self, None, timestamp)
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self.__materialize(self.analyzer_l)
+            self._gen = None
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+
+    def _iter(self):
+        if self._data is not None:
+            return iter(self._data)
+        return self._gen()
+
+    def _source(self):
+        """
+        the new lazy object only keeps a weak reference to this one.
+        While this object is alive, its items are recorded the first time 
+        they are produced. Otherwise, as in a chain of calls 
+        like Data(l).map(a).filter(b), nobody else can read them, 
+        so no intermediate list is built
+        """
+        if self._data is not None:
+            data = self._data
+            return lambda: iter(data)
+        ref = weakref.ref(self)
+        gen = self._gen
+        def source():
+            parent = ref()
+            if parent is None:
+                return gen()
+            if parent._data is not None:
+                return iter(parent._data)
+            return parent.__record()
+        return source
+
+    def __record(self):
+        """
+        iterates over the items, keeping them as self.data 
+        when the iteration is complete
+        """
+        items = []
+        for item in self._gen():
+            items.append(item)
+            yield item
+        if self._data is None:
+            self._data = items
+            self._gen = None
+
+    def _pending(self):
+        if self._data is not None:
+            return []
+        return self.analyzer_l
+
+    @catch_exception
+    def __materialize(self, analyzer_l):
+        return list(self._gen())
+
+    def __reduce__(self):
+        # the generator can not be pickled, i.e. to send it to 
+        # a worker process, so it is sent as a regular Data object
+        return (Data, (self.data, self.timestamp))
+
+
+class _ColumnarData(_Base, _AnalysisInterface, _GetRawBase):
+    """
+    Data stored as a dictionary of numpy arrays, one per attribute,
+    all of them with the same length:
+
+        self.data = {
+                     col1: <numpy.ndarray>,
+                     col2: <numpy.ndarray>,
+                     ...
+                    }
+    """
+    __slots__ = ('codes',)
+
+    # there is no transform() for columns
+    _transformable = False
+
+    def __init__(self, data, timestamp=None, codes=None):
+        """
+        :param data: dictionary of numpy arrays
+        :param timestamp: the time when this object was created
+        :param codes: dictionary {column: (codes, uniques)} 
+                      for the columns already factorized
+        """
+        super(_ColumnarData, self).__init__(data, timestamp)
+        if type(self.data) is not dict:
+            self.log.error('Input data %s is not a dict. Raising exception', data)
+            raise IncorrectInputDataType(dict)
+        self.codes = {} if codes is None else codes
+
+    def _factorized(self, col):
+        """
+        the integer codes and distinct values of a column, 
+        computed the first time they are needed
+        :rtype tuple: (codes, uniques)
+        """
+        factorized = self.codes.get(col)
+        if factorized is None:
+            factorized = self.codes[col] = _factorize(self.data[col])
+        return factorized
+
+    def _columns(self, analyzer):
+        """
+        the columns to be passed to a vectorized analyzer method
+        """
+        columns_used = getattr(analyzer, 'columns_used', None)
+        if columns_used is None:
+            return self.data
+        return {col: self.data[col] for col in columns_used}
+
+    def _rows(self):
+        """
+        rebuilds the items, with native Python values, 
+        for analyzers with no vectorized method
+        """
+        cols = list(self.data.keys())
+        columns = [values.tolist() for values in self.data.values()]
+        return [_Row(zip(cols, values)) for values in zip(*columns)]
+
+    def _take(self, index):
+        """
+        new _ColumnarData with the rows selected by index
+        :param index: a boolean mask, or an array or list of positions
+        """
+        new_data = {col: values[index] for col, values in self.data.items()}
+        new_codes = {col: (codes[index], uniques) 
+                     for col, (codes, uniques) in self.codes.items()}
+        return _ColumnarData(new_data, timestamp=self.timestamp, codes=new_codes)
+
+    # -------------------------------------------------------------------------
+    # methods to manipulate the data
+    # -------------------------------------------------------------------------
+
+    @validate_call
+    def filter(self, analyzer):
+        """
+        eliminates the rows that do not pass the filter 
+        implemented in analyzer.
+        When the analyzer implements method vec_filter(), 
+        it is called once with the columns and must return a boolean mask.
+        Otherwise, method filter() is called for each row.
+        :param analyzer: an instance of AnalyzerFilter-type class 
+        :rtype _ColumnarData:
+        """
+        self.log.debug('Starting with analyzer %s', analyzer)
+        new_info = self.__filter(analyzer)
+        return new_info
+
+    @catch_exception
+    def __filter(self, analyzer):
+        if analyzer.vec_filter is not None:
+            mask = analyzer.vec_filter(self._columns(analyzer))
+        else:
+            mask = _asarray([analyzer.filter(row) for row in self._rows()], 
+                           dtype=bool)
+        return self._take(mask)
+
+    # -------------------------------------------------------------------------
+
+    @validate_call
+    def indexby(self, analyzer):
+        """
+        groups the rows according to the keys from the analyzer.
+        When the analyzer implements method vec_indexby(), 
+        it is called once with the columns and must return 
+        an array with the key for each row.
+        When the analyzer only sets attribute, the key is the value 
+        of that column, and rows are grouped by its integer codes.
+        Otherwise, method indexby() is called for each row.
+        :param analyzer: an instance of AnalyzerIndexBy-type class 
+        :rtype _DictData:
+        """
+        self.log.debug('Starting with analyzer %s', analyzer)
+        if self._vectorizable(analyzer):
+            import numpy
+            keys, found, uniques = self.__vec_keys(analyzer)
+            if found is None:
+                rows = numpy.arange(len(keys))
+            else:
+                rows = numpy.flatnonzero(found)
+                keys = keys[rows]
+            groups = self.__vec_groups(keys, rows, uniques)
+        else:
+            groups = self.__row_groups(analyzer)
+        new_info = self._group(groups)
+        return new_info
+
+    def _vectorizable(self, analyzer):
+        """
+        True when the keys from the analyzer can be computed at once.
+        A mapping, or a column used directly as key, can not 
+        when some of its values are tuples or lists, 
+        meaning several keys for the same row
+        """
+        if not _vectorized_indexby(analyzer):
+            return False
+        multikey = _MULTIKEY
+        if analyzer.mapping is not None:
+            return not any(type(key) in multikey for key in analyzer.mapping.values())
+        if analyzer.vec_indexby is not None:
+            return True
+        try:
+            codes, uniques = self._factorized(analyzer.attribute)
+        except TypeError:
+            # values that can not be hashed, like lists
+            return False
+        return not any(type(value) in multikey for value in uniques.tolist())
+
+    def _group(self, groups):
+        """
+        :param groups: dictionary {key: positions of the rows}
+        :rtype _DictData: with the rows for each key, 
+                          remembering the positions for further indexby()
+        """
+        new_data = {key: self._take(rows) for key, rows in groups.items()}
+        return _DictData(new_data, 
+                         timestamp=self.timestamp, 
+                         group_info=(self, groups))
+
+    def _regroup(self, analyzer, groups):
+        """
+        splits again rows already grouped by a previous indexby().
+        The keys from the vectorized analyzer are computed only once, 
+        for all rows, instead of once per group
+        :param analyzer: an instance of AnalyzerIndexBy-type class 
+                         with vec_indexby() or mapping
+        :param groups: dictionary {key: positions of the rows}
+        :rtype dict: {key: _DictData}
+        """
+        import numpy
+        keys, found, uniques = self.__vec_keys(analyzer)
+        new_data = {}
+        for key, rows in groups.items():
+            rows = numpy.asarray(rows, dtype=numpy.intp)
+            if found is not None:
+                rows = rows[found[rows]]
+            new_data[key] = self._group(self.__vec_groups(keys[rows], rows, uniques))
+        return new_data
+
+    @catch_exception
+    def __vec_keys(self, analyzer):
+        """
+        computes at once the key for every row.
+        With a mapping, the distinct values in column analyzer.attribute 
+        are looked up in the mapping, and each row takes the translation 
+        of its code. Rows whose value is not in the mapping get no key.
+        With only an attribute, the keys are the codes of that column.
+        :return: array with the key for each row, 
+                 boolean mask with the rows that have a key, 
+                 or None if all of them have one, 
+                 and array of distinct keys when the keys are codes into it, 
+                 or None
+        """
+        import numpy
+        if analyzer.mapping is None:
+            if analyzer.vec_indexby is None:
+                codes, uniques = self._factorized(analyzer.attribute)
+                # like indexby() returning None, rows with None get no key
+                for code, value in enumerate(uniques.tolist()):
+                    if value is None:
+                        return codes, codes != code, uniques
+                return codes, None, uniques
+            keys = analyzer.vec_indexby(self._columns(analyzer))
+            return numpy.asarray(keys), None, None
+        values = self.data[analyzer.attribute]
+        if not analyzer.mapping:
+            return values, numpy.zeros(len(values), dtype=bool), None
+        codes, uniques = self._factorized(analyzer.attribute)
+        # the lookups are done with the Python values, 
+        # so keys and translations keep their types, like in indexby()
+        mapping = analyzer.mapping
+        table = [mapping.get(value) for value in uniques.tolist()]
+        found = numpy.array([key is not None for key in table], dtype=bool)
+        key_codes, key_uniques = _factorize(
+            numpy.fromiter((key for key in table if key is not None), 
+                           dtype=object, count=int(found.sum())))
+        table_codes = numpy.zeros(len(table), dtype=numpy.int32)
+        table_codes[found] = key_codes
+        return numpy.take(table_codes, codes), numpy.take(found, codes), key_uniques
+
+    def __vec_groups(self, keys, rows, uniques=None):
+        """
+        splits the row positions by key, in C: 
+        a stable sort of the keys puts rows with the same key together,
+        and the first position of each distinct key marks where to split
+        :param keys: array with one key per row
+        :param rows: array with the positions of those rows
+        :param uniques: when keys are integer codes, the key for each code
+        :rtype dict: {key: positions of the rows}
+        """
+        import numpy
+        order = numpy.argsort(keys, kind='stable')
+        if uniques is not None:
+            # the number of rows per code gives where to split
+            counts = numpy.bincount(keys, minlength=len(uniques))
+            present = numpy.flatnonzero(counts)
+            ends = numpy.cumsum(counts[present])
+            return dict(zip(uniques[present].tolist(), 
+                            numpy.split(rows[order], ends[:-1])))
+        uniques, first = numpy.unique(keys[order], return_index=True)
+        return dict(zip(uniques.tolist(), numpy.split(rows[order], first[1:])))
+
+    @catch_exception
+    def __row_groups(self, analyzer):
+        """
+        splits the row positions by key, calling indexby() for each row
+        """
+        tmp_new_data = defaultdict(list)
+        indexby = analyzer.indexby
+        multikey = _MULTIKEY
+        for i, row in enumerate(self._rows()):
+            key_l = indexby(row)
+            if key_l is None:
+                continue
+            if type(key_l) not in multikey:
+                tmp_new_data[key_l].append(i)
+                continue
+            for key in key_l:
+                tmp_new_data[key].append(i)
+        return dict(tmp_new_data)
+
+    # -------------------------------------------------------------------------
+
+    @validate_call
+    def reduce(self, analyzer):
+        """
+        accumulates the values of the rows.
+        When the analyzer sets 'attribute' and either 'kernel' or 'op',
+        the column for that attribute is reduced at once. 
+        Otherwise, method reduce() is called for each row.
+        :param analyzer: an instance of AnalyzerReduce-type class 
+        :rtype _NonMutableData:
+        """
+        self.log.debug('Starting with analyzer %s', analyzer)
+        new_data = self.__reduce(analyzer)
+        new_info = _NonMutableData(new_data, timestamp=self.timestamp)
+        return new_info
+
+    @catch_exception
+    def __reduce(self, analyzer):
+        initialvalue = analyzer.initialvalue()
+        if analyzer.attribute is not None:
+            values = self.data[analyzer.attribute]
+            if analyzer.kernel is not None:
+                if initialvalue is not None:
+                    return analyzer.kernel(values, initialvalue)
+                return analyzer.kernel(values)
+            if analyzer.op is not None:
+                import numpy
+                out = getattr(numpy, _UFUNC_OPS[analyzer.op]).reduce(values).item()
+                if initialvalue is not None:
+                    return _REDUCE_OPS[analyzer.op]((initialvalue, out))
+                return out
+        if initialvalue is not None:
+            return reduce(analyzer.reduce, self._rows(), initialvalue)
+        return reduce(analyzer.reduce, self._rows())
+
+    # -------------------------------------------------------------------------
+
+    def pipeline(self, filters=(), indexers=(), reducer=None):
+        """
+        same output as calling filter() with each analyzer in filters, 
+        then indexby() with each analyzer in indexers, 
+        and finally reduce() with reducer.
+        When all of them are vectorized (vec_filter(), vec_indexby(), mapping 
+        or attribute, and attribute with op or kernel), the rows are filtered with one mask,
+        the keys of all levels are combined into a single group id per row, 
+        and all groups are reduced at once, without intermediate objects.
+        Otherwise, the methods are called in turn.
+        :param filters: list of AnalyzerFilter-type objects
+        :param indexers: list of AnalyzerIndexBy-type objects
+        :param reducer: an AnalyzerReduce-type object
+        :rtype _NonMutableDictData:
+        """
+        _check_pipeline(filters, indexers, reducer)
+        self.log.debug('Starting with filters %s, indexers %s, reducer %s', 
+                       filters, indexers, reducer)
+        vectorized = indexers and \
+            reducer is not None and \
+            _vectorized_reduce(reducer) and \
+            all(analyzer.vec_filter is not None for analyzer in filters) and \
+            all(self._vectorizable(analyzer) for analyzer in indexers)
+        if not vectorized:
+            return _chain(self, filters, indexers, reducer)
+        tree = self.__pipeline(filters, indexers, reducer)
+        leaf = lambda value: _NonMutableData(value, timestamp=self.timestamp)
+        return _wrap_tree(tree, len(indexers), leaf, 
+                          _NonMutableDictData, self.timestamp)
+
+    def __pipeline(self, filters, indexers, reducer):
+        """
+        :return: nested dictionaries, one level per indexer, 
+                 with the reduced value for each key in the last level
+        """
+        import numpy
+        nrows = self.__count()
+        mask = numpy.ones(nrows, dtype=bool)
+        for analyzer in filters:
+            mask &= self.__vec_mask(analyzer)
+        rows = numpy.flatnonzero(mask)
+
+        # gid is the group of each row, 
+        # and prefix_l the tuple of keys for each group
+        gid = numpy.zeros(len(rows), dtype=numpy.intp)
+        prefix_l = [()]
+        # groups left with no rows in a level, but present in the previous one 
+        empty_l = []
+        for analyzer in indexers:
+            keys, found, key_uniques = self.__vec_keys(analyzer)
+            if found is not None:
+                keep = found[rows]
+                empty_l.extend(prefix_l[g] for g in numpy.unique(gid[~keep]).tolist())
+                rows = rows[keep]
+                gid = gid[keep]
+            uniques, codes = numpy.unique(keys[rows], return_inverse=True)
+            if key_uniques is not None:
+                uniques = key_uniques[uniques]
+            uniques = uniques.tolist()
+            ngroups, gid = numpy.unique(gid * len(uniques) + codes.ravel(), 
+                                        return_inverse=True)
+            gid = gid.ravel()
+            prefix_l = [prefix_l[g // len(uniques)] + (uniques[g % len(uniques)],)
+                        for g in ngroups.tolist()]
+
+        value_l = self.__reduce_groups(reducer, rows, gid, len(prefix_l))
+        tree = {}
+        for prefix in empty_l:
+            node = tree
+            for key in prefix:
+                node = node.setdefault(key, {})
+        for prefix, value in zip(prefix_l, value_l):
+            node = tree
+            for key in prefix[:-1]:
+                node = node.setdefault(key, {})
+            node[prefix[-1]] = value
+        return tree
+
+    def _reduce_groups(self, analyzer, groups):
+        """
+        reduces the rows of all groups from a previous indexby() at once,
+        reusing the positions of the rows in each group
+        :param analyzer: an instance of AnalyzerReduce-type class 
+                         with attribute, and op, kernel or group_kernel
+        :param groups: dictionary {key: positions of the rows}
+        :rtype dict: {key: reduced value}
+        """
+        import numpy
+        if not groups:
+            return {}
+        rows_l = [numpy.asarray(rows, dtype=numpy.intp) for rows in groups.values()]
+        rows = numpy.concatenate(rows_l)
+        gid = numpy.repeat(numpy.arange(len(rows_l)), [len(r) for r in rows_l])
+        value_l = self.__reduce_groups(analyzer, rows, gid, len(rows_l))
+        return dict(zip(groups.keys(), value_l))
+
+    @catch_exception
+    def __vec_mask(self, analyzer):
+        return analyzer.vec_filter(self._columns(analyzer))
+
+    @catch_exception
+    def __reduce_groups(self, analyzer, rows, gid, ngroups):
+        """
+        reduces column analyzer.attribute for all groups at once,
+        with the analyzer group_kernel, if any, or sorting the rows by group, 
+        so each group is a contiguous segment
+        :param rows: positions of the rows
+        :param gid: group of each row, from 0 to ngroups - 1
+        :rtype list: the reduced value for each group
+        """
+        import numpy
+        if ngroups == 0 or len(rows) == 0:
+            return []
+        initialvalue = analyzer.initialvalue()
+        if analyzer.group_kernel is not None:
+            values = self.data[analyzer.attribute][rows]
+            gid = gid.astype(numpy.intp, copy=False)
+            if initialvalue is not None:
+                return analyzer.group_kernel(values, gid, ngroups, initialvalue).tolist()
+            return analyzer.group_kernel(values, gid, ngroups).tolist()
+        order = numpy.argsort(gid, kind='stable')
+        values = self.data[analyzer.attribute][rows[order]]
+        starts = numpy.concatenate(([0], numpy.cumsum(numpy.bincount(gid))[:-1]))
+        if analyzer.kernel is not None:
+            ends = numpy.append(starts[1:], len(values))
+            if initialvalue is not None:
+                return [analyzer.kernel(values[i:j], initialvalue) 
+                        for i, j in zip(starts.tolist(), ends.tolist())]
+            return [analyzer.kernel(values[i:j]) 
+                    for i, j in zip(starts.tolist(), ends.tolist())]
+        ufunc = getattr(numpy, _UFUNC_OPS[analyzer.op])
+        out = ufunc.reduceat(values, starts).tolist()
+        if initialvalue is not None:
+            func = _BINARY_OPS[analyzer.op]
+            out = [func(initialvalue, value) for value in out]
+        return out
+
+    def count(self):
+        new_data = self.__count()
+        new_info = _NonMutableData(new_data, timestamp=self.timestamp)
+        return new_info
+
+    def __count(self):
+        for values in self.data.values():
+            return len(values)
+        return 0
+
+
+class _Row(dict):
+    """
+    a row rebuilt from _ColumnarData. 
+    Values can be read both as row[name] and as row.name, 
+    so analyzers written for dictionaries and for objects work
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
 
 class _NonMutableData(_Base, _GetRawBase):
-    pass
+    __slots__ = ()
 
 class _NonMutableDictData(_BaseDict):
-    pass
+    __slots__ = ()
 
 
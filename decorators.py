@@ -1,3 +1,8 @@
+from datamanipylator.exceptions import (
+    IncorrectAnalyzer,
+    AnalyzerFailure,
+)
+
 # =============================================================================
 #  Decorators 
 #
@@ -14,17 +19,15 @@ def validate_call(method):
         * if a method is being called with the right type of Analyzer
     Exceptions are raised with some criteria is not met.
     """
+    # resolved once, when the class is created, not on every call
+    method_name = method.__name__
     def wrapper(self, analyzer, *k, **kw):
-        method_name = method.__name__
         analyzertype = analyzer.analyzertype
-        if not analyzertype == method_name:
-            msg = 'Analyzer object {obj} is not type {name}. Raising exception.'
-            msg = msg.format(obj = analyzer,
-                             name = method_name)
-            self.log.error(msg)
+        if analyzertype != method_name:
+            self.log.error('Analyzer object %s is not type %s. Raising exception.',
+                           analyzer, method_name)
             raise IncorrectAnalyzer(analyzer, analyzertype, method_name)
-        out = method(self, analyzer, *k, **kw)
-        return out
+        return method(self, analyzer, *k, **kw)
     return wrapper
 
 
@@ -33,14 +36,14 @@ def catch_exception(method):
     catches any exception during data processing
     and raises an AnalyzerFailure exception
     """
-    def wrapper(self, analyzer):
+    def wrapper(self, analyzer, *k, **kw):
         try:
-            out = method(self, analyzer)
+            out = method(self, analyzer, *k, **kw)
         except Exception as ex:
             msg = 'Exception of type "%s" ' %ex.__class__.__name__
             msg += 'with content "%s" ' %ex
             msg += 'while calling "%s" ' %method.__name__
-            msg += 'with analyzer "%s"' %analyzer
+            msg += 'with analyzer "%s"' %(analyzer,)
             raise AnalyzerFailure(msg)
         else:
             return out
@@ -1,41 +1,51 @@
-class IncorrectInputDataType(Exception):
+class _MessageException(Exception):
+    """
+    base for the exceptions in this package.
+    The message is only stored in self.args, 
+    and still available as attribute value
+    """
+
+    @property
+    def value(self):
+        return self.args[0]
+
+    def __reduce__(self):
+        # the message is restored as it is, not passed again to __init__(),
+        # so the exceptions raised in a pool of processes can be unpickled
+        return (_restore, (type(self), self.args))
+
+
+def _restore(cls, args):
+    exc = Exception.__new__(cls)
+    exc.args = args
+    return exc
+
+
+class IncorrectInputDataType(_MessageException):
     def __init__(self, type):
-        self.value = 'Type of input data is not %s' %type
-    def __str__(self):
-        return repr(self.value)
+        name = getattr(type, '__name__', type)
+        super(IncorrectInputDataType, self).__init__(f'Type of input data is not {name}')
 
 
-class NotAnAnalyzer(Exception):
+class NotAnAnalyzer(_MessageException):
     def __init__(self):
-        self.value = 'object does not have a valid analyzertype value'
-    def __str__(self):
-        return repr(self.value)
+        super(NotAnAnalyzer, self).__init__('object does not have a valid analyzertype value')
 
 
-class IncorrectAnalyzer(Exception):
+class IncorrectAnalyzer(_MessageException):
     def __init__(self, analyzer, analyzertype, methodname):
-        value = "Analyzer object {ana} is of type '{atype}' but used for '{call}()'" 
-        self.value = value.format(ana=analyzer, 
-                                  atype=analyzertype, 
-                                  call=methodname)
-    def __str__(self):
-        return repr(self.value)
+        msg = f"Analyzer object {analyzer} is of type '{analyzertype}' but used for '{methodname}()'"
+        super(IncorrectAnalyzer, self).__init__(msg)
 
 
-class MissingKeyException(Exception):
+class MissingKeyException(_MessageException):
     def __init__(self, key):
-        self.value = "Key %s is not in the data dictionary" %key
-    def __str__(self):
-        return repr(self.value)
+        super(MissingKeyException, self).__init__(f'Key {key} is not in the data dictionary')
 
 
-class AnalyzerFailure(Exception):
+class AnalyzerFailure(_MessageException):
     """
     generic Exception for any unclassified failure
     """
     def __init__(self, value):
-        self.value = value
-    def __str__(self):
-        return repr(self.value)
-
-
+        super(AnalyzerFailure, self).__init__(value)
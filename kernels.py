@@ -0,0 +1,83 @@
+# =============================================================================
+#  Ready to use kernels for the Analyzers 'kernel' and 'group_kernel' attributes.
+#
+#   Note:
+#   they are compiled with numba when it is installed, 
+#   otherwise they run as regular Python functions
+# =============================================================================
+
+import numpy
+
+try:
+    from numba import njit, prange, get_num_threads, types
+except ImportError:
+    def njit(*k, **kw):
+        def decorator(func):
+            return func
+        return decorator
+    prange = range
+    get_num_threads = lambda: 1
+    _ARRAY_TYPES = ()
+else:
+    # types of contiguous arrays whose signatures are compiled 
+    # (or loaded from the cache) when this module is imported, 
+    # instead of on their first call. 
+    # Other arrays are compiled on their first call
+    _ARRAY_TYPES = (types.float64, types.float32, 
+                    types.int64, types.int32, types.boolean)
+
+
+@njit(cache=True, nogil=True)
+def sum_kernel(arr, init=0.0):
+    """
+    adds all values in a numpy array
+    :param arr: numpy array of numbers
+    :param init: initial value
+    :rtype float: a float64, also for arrays of integers or booleans,
+                  unless init is an integer
+    """
+    s = init
+    for i in range(len(arr)):
+        s += arr[i]
+    return s
+
+
+def group_sum_kernel(values, gid, ngroups, init=0.0):
+    """
+    adds the values of each group, for the 'group_kernel' attribute,
+    using all the threads available to numba
+    :param values: numpy array of numbers
+    :param gid: numpy array with the group of each value, from 0 to ngroups - 1
+    :param ngroups: number of groups
+    :param init: initial value for each group
+    :rtype numpy.ndarray: float64 array with the sum for each group
+    """
+    return _group_sum(values, gid, ngroups, float(init), get_num_threads())
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _group_sum(values, gid, ngroups, init, nthreads):
+    """
+    rows are split in one chunk per thread, 
+    each chunk adds its rows into its own partial sums, 
+    and partial sums are added at the end, so threads never write
+    to the same place
+    """
+    n = len(values)
+    nchunks = max(1, min(nthreads, n))
+    size = (n + nchunks - 1) // nchunks
+    partial = numpy.zeros((nchunks, ngroups))
+    for c in prange(nchunks):
+        for i in range(c * size, min(n, (c + 1) * size)):
+            partial[c, gid[i]] += values[i]
+    out = numpy.full(ngroups, init)
+    for c in range(nchunks):
+        out += partial[c]
+    return out
+
+
+for _arrtype in _ARRAY_TYPES:
+    for _inittype in (types.float64, types.Omitted(0.0)):
+        sum_kernel.compile(types.float64(_arrtype[::1], _inittype))
+    _group_sum.compile(types.float64[::1](_arrtype[::1], types.intp[::1], 
+                                          types.intp, types.float64, types.intp))
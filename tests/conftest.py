@@ -0,0 +1,18 @@
+import importlib.util
+import os
+import sys
+
+
+# the repository itself is the datamanipylator package:
+# when it is not installed, it is imported from the parent directory
+try:
+    import datamanipylator
+except ImportError:
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    spec = importlib.util.spec_from_file_location(
+        'datamanipylator',
+        os.path.join(root, '__init__.py'),
+        submodule_search_locations=[root])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['datamanipylator'] = module
+    spec.loader.exec_module(module)
@@ -0,0 +1,75 @@
+import pytest
+
+from datamanipylator.algorithm import Algorithm
+from datamanipylator.analyzers import AnalyzerFilter, AnalyzerIndexBy, AnalyzerReduce
+from datamanipylator.data import Data
+from datamanipylator.exceptions import NotAnAnalyzer
+
+
+class C(object):
+    __slots__ = ('name1', 'value')
+    def __init__(self, name1, value):
+        self.name1 = name1
+        self.value = value
+
+
+RECORDS = [C('foo', 4), C('foo', 8), C('bar', 3), C('bar', 1), C('foo', 2)]
+
+
+class TooLarge(AnalyzerFilter):
+    def filter(self, c):
+        return c.value <= 5
+
+
+class Small(AnalyzerFilter):
+    def filter(self, c):
+        return c.value > 1
+
+
+class ByName1(AnalyzerIndexBy):
+    attribute = 'name1'
+    def indexby(self, c):
+        return c.name1
+
+
+class Total(AnalyzerReduce):
+    attribute = 'value'
+    op = 'sum'
+
+
+def algorithm(*analyzers):
+    out = Algorithm()
+    for analyzer in analyzers:
+        out.add(analyzer)
+    return out
+
+
+def test_fused_filters_on_list_data():
+    out = algorithm(TooLarge(), Small()).analyze(Data(RECORDS)).getraw()
+    assert out == Data(RECORDS).filter(TooLarge()).filter(Small()).getraw()
+
+
+def test_fused_filters_on_columnar_data():
+    pytest.importorskip('numpy')
+    columnar = Data.from_records(RECORDS, ('name1', 'value'))
+    out = algorithm(TooLarge(), Small()).analyze(columnar).getraw()
+    assert out['value'].tolist() == [4, 3, 2]
+    out = algorithm(ByName1(), TooLarge(), Small(), Total()).analyze(columnar).getraw()
+    assert out == {'foo': 6, 'bar': 3}
+
+
+@pytest.mark.parametrize('analyzertype', ['foo', 'count', 'get', 'pipeline', None])
+def test_add_rejects_unknown_types(analyzertype):
+    class Fake(object):
+        pass
+    fake = Fake()
+    fake.analyzertype = analyzertype
+    with pytest.raises(NotAnAnalyzer):
+        Algorithm().add(fake)
+    with pytest.raises(NotAnAnalyzer):
+        Algorithm().add(object())
+
+
+def test_analyzer_list():
+    analyzers = (TooLarge(), Small(), ByName1())
+    assert algorithm(*analyzers).analyzer_l == list(analyzers)
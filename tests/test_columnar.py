@@ -0,0 +1,148 @@
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from datamanipylator.analyzers import AnalyzerIndexBy, AnalyzerReduce
+from datamanipylator.data import Data
+
+
+class C(object):
+    __slots__ = ('name1', 'name2', 'value')
+    def __init__(self, name1, name2, value):
+        self.name1 = name1
+        self.name2 = name2
+        self.value = value
+
+
+FIELDS = ('name1', 'name2', 'value')
+
+
+class ByName1(AnalyzerIndexBy):
+    attribute = 'name1'
+    def indexby(self, c):
+        return c.name1
+
+
+class ByName2(AnalyzerIndexBy):
+    attribute = 'name2'
+    def indexby(self, c):
+        return c.name2
+
+
+def mapped(mapping):
+    class MapName2(AnalyzerIndexBy):
+        attribute = 'name2'
+        def indexby(self, c):
+            return self.mapping.get(c.name2)
+    MapName2.mapping = mapping
+    return MapName2()
+
+
+class Total(AnalyzerReduce):
+    attribute = 'value'
+    op = 'sum'
+
+
+def expected(records, *indexers):
+    data = Data(records)
+    for analyzer in indexers:
+        data = data.indexby(analyzer)
+    return data.reduce(Total()).getraw()
+
+
+def grouped(data, *indexers):
+    for analyzer in indexers:
+        data = data.indexby(analyzer)
+    return data.reduce(Total()).getraw()
+
+
+def test_from_records_with_none_in_text_field():
+    records = [C('foo', 'a', 1), C(None, 'b', 2), C('bar', 'a', 3)]
+    columnar = Data.from_records(records, FIELDS)
+    assert grouped(columnar, ByName2()) == expected(records, ByName2())
+    # rows with None get no key, like indexby() returning None
+    assert grouped(columnar, ByName1()) == expected(records, ByName1())
+    assert columnar.pipeline([], [ByName1(), ByName2()], Total()).getraw() == \
+        expected(records, ByName1(), ByName2())
+
+
+def test_to_columnar_with_none_in_text_field():
+    items = [{'name1': 'foo', 'value': 1}, {'name1': None, 'value': 2}]
+    columnar = Data(items).to_columnar(('name1', 'value'))
+    assert columnar.indexby(ByName1()).reduce(Total()).getraw() == {'foo': 1}
+
+
+def test_from_records_keeps_mixed_types():
+    records = [C('foo', 'a', 1), C('bar', 7, 2), C('foo', 7, 3)]
+    columnar = Data.from_records(records, FIELDS)
+    assert columnar.getraw()['name2'].tolist() == ['a', 7, 7]
+    assert grouped(columnar, ByName2()) == {'a': 1, 7: 5}
+    assert grouped(columnar, ByName2()) == expected(records, ByName2())
+
+
+def test_column_with_several_keys_per_row():
+    records = [C('foo', ('a', 'b'), 1), C('bar', 'a', 2), C('foo', ['a'], 3)]
+    columnar = Data.from_records(records, FIELDS)
+    assert grouped(columnar, ByName2()) == expected(records, ByName2())
+    assert grouped(columnar, ByName1(), ByName2()) == \
+        expected(records, ByName1(), ByName2())
+
+
+@pytest.mark.parametrize('mapping', [
+    {'test1': 1, 'test2': 'two'},
+    {'test1': None, 'test2': 'x', 3: 'three'},
+    {'test1': ('a', 'b'), 'test3': 'c'},
+    {'nope': 1},
+    {},
+])
+def test_mapping_keeps_key_types(mapping):
+    records = [C('foo', 'test1', 4), C('bar', 'test2', 8), C('foo', 'test3', 2),
+               C('bar', 3, 5), C('foo', None, 1)]
+    columnar = Data.from_records(records, FIELDS)
+    analyzer = mapped(mapping)
+    assert grouped(columnar, analyzer) == expected(records, analyzer)
+    assert grouped(columnar, ByName1(), analyzer) == \
+        expected(records, ByName1(), analyzer)
+    assert columnar.pipeline([], [ByName1(), analyzer], Total()).getraw() == \
+        expected(records, ByName1(), analyzer)
+
+
+def test_mapping_value_type():
+    records = [C('foo', 'test1', 4), C('bar', 'test2', 8)]
+    columnar = Data.from_records(records, FIELDS)
+    out = grouped(columnar, mapped({'test1': 1, 'test2': 'two'}))
+    assert out == {1: 4, 'two': 8}
+    assert type(list(out)[0]) is int
+
+
+def test_column_types():
+    records = [C('foo', 'x' * 5000, 1), C('bar', True, 2.5)]
+    columns = Data.from_records(records, FIELDS).getraw()
+    assert columns['name1'].dtype == object
+    assert columns['name2'].dtype == object
+    assert columns['value'].dtype == numpy.float64
+    items = [{'flag': True, 'n': 1}, {'flag': False, 'n': numpy.int32(2)}]
+    columns = Data(items).to_columnar(('flag', 'n')).getraw()
+    assert columns['flag'].dtype == bool
+    assert columns['n'].dtype.kind == 'i'
+
+
+class ClassifyName2(AnalyzerIndexBy):
+    # no indexby(): the default one uses attribute and mapping
+    attribute = 'name2'
+    mapping = {'test1': 'first', 'test2': 'second'}
+
+
+def test_mapping_without_indexby():
+    records = [C('foo', 'test1', 4), C('bar', 'test2', 8), C('foo', 'test3', 2),
+               C('bar', 'test1', 5)]
+    assert expected(records, ClassifyName2()) == {'first': 9, 'second': 8}
+    assert Data(records).pipeline([], [ClassifyName2()], Total()).getraw() == \
+        {'first': 9, 'second': 8}
+    columnar = Data.from_records(records, FIELDS)
+    assert grouped(columnar, ClassifyName2()) == {'first': 9, 'second': 8}
+    # a column with several keys per row is grouped row by row
+    records.append(C('foo', ('test1', 'test2'), 1))
+    columnar = Data.from_records(records, FIELDS)
+    assert grouped(columnar, ByName1(), ClassifyName2()) == \
+        expected(records, ByName1(), ClassifyName2())
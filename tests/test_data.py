@@ -0,0 +1,96 @@
+import weakref
+
+import pytest
+
+from datamanipylator.analyzers import AnalyzerFilter, AnalyzerMap
+from datamanipylator.data import Data
+
+
+class Running(AnalyzerFilter):
+    columns_used = ('JobStatus',)
+    def filter(self, job):
+        return job['JobStatus'] == 2
+    def vec_filter(self, cols):
+        return cols['JobStatus'] == 2
+
+
+JOBS = [{'JobStatus': 2, 'RequestCpus': 1},
+        {'JobStatus': 1, 'RequestCpus': 4},
+        {'JobStatus': 2, 'RequestCpus': 8}]
+
+
+def test_vec_filter_on_list_data_uses_filter():
+    assert Data(JOBS).filter(Running()).getraw() == [JOBS[0], JOBS[2]]
+
+
+def test_vec_filter_on_columnar_data():
+    pytest.importorskip('numpy')
+    columnar = Data(JOBS).to_columnar(('JobStatus', 'RequestCpus'))
+    out = columnar.filter(Running()).getraw()
+    assert out['RequestCpus'].tolist() == [1, 8]
+
+
+def test_filter_kernel_keeps_items():
+    pytest.importorskip('numpy')
+    class FirstLarge(AnalyzerFilter):
+        kernel = staticmethod(lambda arr: arr[:, 0] > 1)
+        def filter(self, item):
+            return item[0] > 1
+    assert Data([(1, 2), (3, 4)]).filter(FirstLarge()).getraw() == [(3, 4)]
+
+
+class Counted(AnalyzerMap):
+    __slots__ = ('calls',)
+    def __init__(self):
+        self.calls = 0
+    def map(self, x):
+        self.calls += 1
+        return x * 2
+
+
+class Above(AnalyzerFilter):
+    def filter(self, x):
+        return x > 4
+
+
+class Below(AnalyzerFilter):
+    def filter(self, x):
+        return x < 10
+
+
+def test_lazy_branches_share_items():
+    analyzer = Counted()
+    mapped = Data(list(range(9))).map(analyzer)
+    above = mapped.filter(Above())
+    below = mapped.filter(Below())
+    assert above.getraw() == [6, 8, 10, 12, 14, 16]
+    assert below.getraw() == [0, 2, 4, 6, 8]
+    assert mapped.getraw() == [x * 2 for x in range(9)]
+    assert analyzer.calls == 9
+
+
+def test_lazy_chain_is_not_repeated():
+    analyzer = Counted()
+    out = Data(list(range(9))).map(analyzer).filter(Above()).getraw()
+    assert out == [6, 8, 10, 12, 14, 16]
+    assert analyzer.calls == 9
+
+
+def test_lazy_parent_after_its_branch():
+    analyzer = Counted()
+    mapped = Data([1, 2, 3]).map(analyzer)
+    assert mapped.filter(Above()).getraw() == [6]
+    assert mapped.getraw() == [2, 4, 6]
+    assert analyzer.calls == 3
+
+
+def test_lazy_chain_keeps_no_intermediate_list():
+    analyzer = Counted()
+    mapped = Data([1, 2, 3]).map(analyzer)
+    filtered = mapped.filter(Above())
+    ref = weakref.ref(mapped)
+    del mapped
+    # nothing is left to keep the mapped items for
+    assert ref() is None
+    assert filtered.getraw() == [6]
+    assert analyzer.calls == 3
@@ -0,0 +1,29 @@
+import pickle
+
+import pytest
+
+from datamanipylator.exceptions import (
+    IncorrectInputDataType,
+    NotAnAnalyzer,
+    IncorrectAnalyzer,
+    MissingKeyException,
+    AnalyzerFailure,
+)
+
+
+@pytest.mark.parametrize('exc, value', [
+    (IncorrectInputDataType(dict), 'Type of input data is not dict'),
+    (NotAnAnalyzer(), 'object does not have a valid analyzertype value'),
+    (IncorrectAnalyzer('A', 'map', 'filter'), 
+     "Analyzer object A is of type 'map' but used for 'filter()'"),
+    (MissingKeyException('foo'), 'Key foo is not in the data dictionary'),
+    (AnalyzerFailure('it failed'), 'it failed'),
+])
+def test_pickle_round_trip(exc, value):
+    assert exc.value == value
+    new = pickle.loads(pickle.dumps(exc))
+    assert type(new) is type(exc)
+    assert new.value == value
+    assert new.args == (value,)
+    assert str(new) == value
+
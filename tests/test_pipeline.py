@@ -0,0 +1,215 @@
+import pytest
+
+numpy = pytest.importorskip('numpy')
+
+from datamanipylator.analyzers import AnalyzerFilter, AnalyzerIndexBy, AnalyzerReduce
+from datamanipylator.data import Data
+from datamanipylator.exceptions import AnalyzerFailure
+from datamanipylator.kernels import sum_kernel, group_sum_kernel
+
+
+class C(object):
+    __slots__ = ('name1', 'name2', 'value')
+    def __init__(self, name1, name2, value):
+        self.name1 = name1
+        self.name2 = name2
+        self.value = value
+
+
+RECORDS = [
+    C('foo', 'test1', 4),
+    C('foo', 'test2', 8),
+    C('bar', 'test2', 8),
+    C('bar', 'test2', 3),
+    C('bar', 'test3', 1),
+    C('foo', 'test3', 2),
+    C('foo', 'test3', 2),
+    C('foo', 'test1', 9),
+    C('bar', 'test1', 9),
+]
+FIELDS = ('name1', 'name2', 'value')
+
+
+# ---------------------------------------------------------------------------
+# analyzers
+# ---------------------------------------------------------------------------
+
+class TooLarge(AnalyzerFilter):
+    __slots__ = ('x',)
+    columns_used = ('value',)
+    def __init__(self, x):
+        self.x = x
+    def filter(self, c):
+        return c.value <= self.x
+    def vec_filter(self, cols):
+        return cols['value'] <= self.x
+
+
+class ClassifyName1(AnalyzerIndexBy):
+    attribute = 'name1'
+    def indexby(self, c):
+        return c.name1
+
+
+class VecParity(AnalyzerIndexBy):
+    columns_used = ('value',)
+    def indexby(self, c):
+        return c.value % 2
+    def vec_indexby(self, cols):
+        return cols['value'] % 2
+
+
+class MapName2(AnalyzerIndexBy):
+    # 'test3' is missing, so those rows get no key
+    attribute = 'name2'
+    mapping = {'test1': 'first', 'test2': 'second'}
+    def indexby(self, c):
+        return self.mapping.get(c.name2)
+
+
+class MultiKey(AnalyzerIndexBy):
+    def indexby(self, c):
+        if c.value == 1:
+            return None
+        if c.value > 5:
+            return ('big',)
+        return ['small', 'any']
+
+
+class Total(AnalyzerReduce):
+    def reduce(self, v1, v2):
+        if hasattr(v1, 'value'):
+            return v1.value + v2.value
+        return v1 + v2.value
+
+
+class OpTotal(AnalyzerReduce):
+    attribute = 'value'
+    op = 'sum'
+    def reduce(self, v1, v2):
+        return v1 + v2.value
+
+
+class OpMax(AnalyzerReduce):
+    attribute = 'value'
+    op = 'max'
+
+
+class KernelTotal(AnalyzerReduce):
+    attribute = 'value'
+    kernel = staticmethod(sum_kernel)
+
+
+class GroupKernelTotal(KernelTotal):
+    group_kernel = staticmethod(group_sum_kernel)
+
+
+def chain(data, filters, indexers, reducer):
+    for analyzer in filters:
+        data = data.filter(analyzer)
+    for analyzer in indexers:
+        data = data.indexby(analyzer)
+    if reducer is not None:
+        data = data.reduce(reducer)
+    return data
+
+
+# ---------------------------------------------------------------------------
+# tests
+# ---------------------------------------------------------------------------
+
+REDUCERS = [Total(0), OpTotal(), OpTotal(10), OpMax(), KernelTotal(), KernelTotal(3)]
+
+LIST_CASES = [
+    ([TooLarge(5)], [ClassifyName1(), MapName2()]),
+    ([TooLarge(8)], [ClassifyName1(), MultiKey(), VecParity()]),
+    ([], [MapName2(), ClassifyName1()]),
+    ([TooLarge(-1)], [ClassifyName1()]),
+    ([], []),
+]
+
+
+@pytest.mark.parametrize('filters, indexers', LIST_CASES)
+@pytest.mark.parametrize('reducer', REDUCERS)
+def test_pipeline_list_data(filters, indexers, reducer):
+    expected = chain(Data(RECORDS), filters, indexers, reducer).getraw()
+    out = Data(RECORDS).pipeline(filters, indexers, reducer).getraw()
+    assert out == expected
+
+
+@pytest.mark.parametrize('filters, indexers', LIST_CASES[:-1])
+def test_pipeline_list_data_without_reducer(filters, indexers):
+    expected = chain(Data(RECORDS), filters, indexers, None).getraw()
+    out = Data(RECORDS).pipeline(filters, indexers, None).getraw()
+    assert out == expected
+
+
+COLUMNAR_CASES = [
+    # vectorized: one mask, one group id per row
+    ([TooLarge(5)], [ClassifyName1(), MapName2()]),
+    ([TooLarge(8)], [ClassifyName1(), MapName2(), VecParity()]),
+    ([], [MapName2(), ClassifyName1()]),
+    # empty result
+    ([TooLarge(-1)], [ClassifyName1(), MapName2()]),
+    # not vectorized: falls back to the chained calls
+    ([TooLarge(8)], [ClassifyName1(), MultiKey()]),
+]
+
+
+@pytest.mark.parametrize('filters, indexers', COLUMNAR_CASES)
+@pytest.mark.parametrize('reducer',
+                         [OpTotal(), OpTotal(10), OpMax(), KernelTotal(),
+                          KernelTotal(3), GroupKernelTotal(), GroupKernelTotal(3)])
+def test_pipeline_columnar_data(filters, indexers, reducer):
+    expected = chain(Data(RECORDS), filters, indexers, reducer).getraw()
+    columnar = Data.from_records(RECORDS, FIELDS)
+    assert chain(columnar, filters, indexers, reducer).getraw() == expected
+    assert columnar.pipeline(filters, indexers, reducer).getraw() == expected
+
+
+class BrokenFilter(AnalyzerFilter):
+    def filter(self, c):
+        return 1 / 0
+
+
+class BrokenIndexBy(AnalyzerIndexBy):
+    def indexby(self, c):
+        return 1 / 0
+
+
+class BrokenReduce(AnalyzerReduce):
+    def reduce(self, v1, v2):
+        return 1 / 0
+
+
+@pytest.mark.parametrize('filters, indexers, reducer', [
+    ([BrokenFilter()], [ClassifyName1()], Total(0)),
+    ([], [ClassifyName1(), BrokenIndexBy()], Total(0)),
+    ([], [ClassifyName1()], BrokenReduce()),
+])
+def test_pipeline_failing_analyzer(filters, indexers, reducer):
+    with pytest.raises(AnalyzerFailure, match='ZeroDivisionError'):
+        Data(RECORDS).pipeline(filters, indexers, reducer)
+
+
+@pytest.mark.parametrize('dtype', [numpy.float64, numpy.float32, numpy.int64, 
+                                   numpy.int32, numpy.uint8, bool])
+def test_kernels_dtypes(dtype):
+    values = numpy.array([1, 0, 1, 1], dtype=dtype)
+    assert sum_kernel(values) == 3.0
+    assert sum_kernel(values, 2.0) == 5.0
+    assert sum_kernel(values[::2], 2.0) == 4.0
+    gid = numpy.array([0, 1, 1, 0], dtype=numpy.intp)
+    assert group_sum_kernel(values, gid, 2).tolist() == [2.0, 1.0]
+    assert group_sum_kernel(values, gid, 2, 1).tolist() == [3.0, 2.0]
+
+
+def test_kernel_reducer_on_bool_column():
+    class Flags(KernelTotal):
+        attribute = 'flag'
+    items = [{'name1': 'a', 'flag': True}, {'name1': 'a', 'flag': False}, 
+             {'name1': 'b', 'flag': True}]
+    columnar = Data(items).to_columnar(('name1', 'flag'))
+    assert columnar.getraw()['flag'].dtype == bool
+    out = columnar.indexby(ClassifyName1()).reduce(Flags()).getraw()
+    assert out == {'a': 1.0, 'b': 1.0}
@@ -0,0 +1,58 @@
+from collections import OrderedDict, defaultdict
+
+import pytest
+
+from datamanipylator.utils import display
+
+
+def recursive_display(nested_dict, indent=0):
+    """
+    display() as it was first written, printing each line
+    """
+    if isinstance(nested_dict, dict):
+        for key, value in nested_dict.items():
+            print(" " * indent + str(key))
+            recursive_display(value, indent + 4)
+    elif isinstance(nested_dict, list):
+        for item in nested_dict:
+            print(" " * (indent) + '%s' %str(item))
+    else:
+        print(" " * (indent) + str(nested_dict))
+
+
+class MyList(list):
+    pass
+
+
+class Formatted(object):
+    def __format__(self, spec):
+        return 'FMT'
+    def __str__(self):
+        return 'W!'
+
+
+def test_display_uses_str(capsys):
+    display({Formatted(): Formatted(), 'key': [Formatted()]})
+    assert capsys.readouterr().out == 'W!\n    W!\nkey\n    W!\n'
+
+
+@pytest.mark.parametrize('value', [
+    {'a': {'b': {'c': 1, 'd': [1, 2]}, 'e': 'x'}, 'f': [3], 2: None},
+    {'a': [], 'b': {}, 'c': [{'d': 1}, (1, 2)], 'e': ''},
+    {},
+    [],
+    [1, 'two', {'three': 3}, [4]],
+    OrderedDict([('z', 1), ('a', OrderedDict([('y', [2])]))]),
+    defaultdict(list, {'a': MyList([1, 2]), 'b': defaultdict(int)}),
+    MyList([MyList([]), 0]),
+    42,
+    None,
+    'text',
+    (1, [2]),
+])
+@pytest.mark.parametrize('indent', [0, 3])
+def test_display_as_recursive_version(capsys, value, indent):
+    recursive_display(value, indent)
+    expected = capsys.readouterr().out
+    display(value, indent)
+    assert capsys.readouterr().out == expected
@@ -1,13 +1,81 @@
+from collections import deque
+
+
+# indent level -> string of spaces, built once per level
+_INDENT_CACHE = {}
+
+
+def _ind(n):
+    s = _INDENT_CACHE.get(n)
+    if s is None:
+        s = _INDENT_CACHE[n] = ' ' * n
+    return s
+
+
 def display(nested_dict, indent=0):
     """
     display the results of the processing
     """
-    if isinstance(nested_dict, dict):
-        for key, value in nested_dict.items():
-            print(" " * indent + str(key))
-            display(value, indent + 4)
-    elif isinstance(nested_dict, list):
-        for item in nested_dict:
-            print(" " * (indent) + '%s' %str(item))
-    else:
-        print(" " * (indent) + str(nested_dict))
+    print(_format(nested_dict, indent), end='')
+
+
+def _format(nested_dict, indent=0):
+    """
+    builds the whole text printed by display(),
+    walking the nested dictionaries with an explicit stack
+    of (indent, key, value) items, and joining all lines at the end.
+    Lines are added with write(), bound once to the list of lines
+    """
+    parts = []
+    write = parts.append
+    stack = deque()
+    _add(nested_dict, indent, write, stack)
+    while stack:
+        indent, key, value = stack.pop()
+        write(f'{_ind(indent)}{key!s}\n')
+        _add(value, indent + 4, write, stack)
+    return ''.join(parts)
+
+
+def _add(value, indent, write, stack):
+    """
+    adds a value to the output, with the handler for its type
+    """
+    handler = _DISPATCH.get(type(value))
+    if handler is None:
+        # subclasses, like defaultdict, are rare: resolve them once here
+        if isinstance(value, dict):
+            handler = _emit_dict
+        elif isinstance(value, list):
+            handler = _emit_list
+        else:
+            handler = _emit_scalar
+    handler(value, indent, write, stack)
+
+
+def _emit_dict(value, indent, write, stack):
+    """
+    pushes the content of a dictionary in the stack,
+    in reversed order so it is popped in the original order
+    """
+    stack.extend((indent, key, child) for key, child in reversed(value.items()))
+
+
+def _emit_list(value, indent, write, stack):
+    """
+    adds all items of the list as a single string, 
+    converting each item with str() only once
+    """
+    if not value:
+        return
+    prefix = _ind(indent)
+    sep = '\n' + prefix
+    write(prefix + sep.join(map(str, value)) + '\n')
+
+
+def _emit_scalar(value, indent, write, stack):
+    write(f'{_ind(indent)}{value!s}\n')
+
+
+# type of the value -> function adding it to the output
+_DISPATCH = {dict: _emit_dict, list: _emit_list}